@@ -3,10 +3,13 @@
 
 import json
 import logging
+import os
 from collections import Counter
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Fall back to INFO for unknown LOG_LEVEL values rather than failing Lambda init
+_log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
 
 
 def analyze_text(text: str, n: int = 5) -> str:
@@ -23,18 +26,39 @@ def analyze_text(text: str, n: int = 5) -> str:
     # Count words
     word_count = len(text.split())
 
-    # Count character frequency (excluding spaces)
-    char_counter = Counter(char.lower() for char in text if char != " ")
+    # Count character frequency (excluding spaces). Lowercasing each character
+    # via map lets Counter tally it in C instead of via a generator expression.
+    char_counter = Counter(map(str.lower, text))
+    char_counter.pop(" ", None)
     top_chars = char_counter.most_common(n)
 
     # Format results
-    result = "Text analysis results:\n"
-    result += f"Word count: {word_count}\n"
-    result += f"Top {n} most frequent characters:\n"
-    for char, count in top_chars:
-        result += f"  '{char}': {count}\n"
+    lines = [
+        "Text analysis results:",
+        f"Word count: {word_count}",
+        f"Top {n} most frequent characters:",
+    ]
+    lines.extend(f"  '{char}': {count}" for char, count in top_chars)
 
-    return result
+    return "\n".join(lines) + "\n"
+
+
+def strip_target_prefix(original_tool_name: str, delimiter: str = "___") -> str:
+    """
+    Strips the Gateway target prefix from a tool name.
+
+    Gateway passes tool names as '{target_name}___{tool_name}'. Names without
+    the delimiter are returned unchanged.
+
+    Args:
+        original_tool_name: Full tool name from the Lambda client context
+        delimiter: Separator between target name and tool name
+
+    Returns:
+        Tool name without the target prefix
+    """
+    _, found, tool_name = original_tool_name.partition(delimiter)
+    return tool_name if found else original_tool_name
 
 
 def handler(event, context):
@@ -65,17 +89,16 @@ def handler(event, context):
     Returns:
         dict: Response object with 'content' array or 'error' string
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Serializing the full event is only worth paying for when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
 
     try:
         # Get tool name from context and strip the target prefix
-        delimiter = "___"
         original_tool_name = context.client_context.custom["bedrockAgentCoreToolName"]
-        tool_name = original_tool_name[
-            original_tool_name.index(delimiter) + len(delimiter) :
-        ]
+        tool_name = strip_target_prefix(original_tool_name)
 
-        logger.info(f"Processing tool: {tool_name}")
+        logger.debug("Processing tool: %s", tool_name)
 
         # This Lambda implements exactly one tool: text_analysis_tool
         if tool_name == "text_analysis_tool":
@@ -89,11 +112,11 @@ def handler(event, context):
             return {"content": [{"type": "text", "text": result}]}
         else:
             # This should never happen if gateway is configured correctly
-            logger.error(f"Unexpected tool name: {tool_name}")
+            logger.error("Unexpected tool name: %s", tool_name)
             return {
                 "error": f"This Lambda only supports 'text_analysis_tool', received: {tool_name}"
             }
 
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
         return {"error": f"Internal server error: {str(e)}"}
@@ -12,14 +12,26 @@ CloudFormation Events:
 """
 
 import logging
+import os
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Fall back to INFO for unknown LOG_LEVEL values rather than failing Lambda init
+_log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
 
-bedrock_client = boto3.client("bedrock-agentcore-control")
-secrets_client = boto3.client("secretsmanager")
+# Clients are created once per container and reused across warm invocations.
+# Keepalive avoids re-establishing connections between calls, and adaptive
+# retries back off on throttling during bursts of stack operations.
+boto_config = Config(
+    tcp_keepalive=True,
+    retries={"max_attempts": 4, "mode": "adaptive"},
+)
+
+bedrock_client = boto3.client("bedrock-agentcore-control", config=boto_config)
+secrets_client = boto3.client("secretsmanager", config=boto_config)
 
 
 def handler(event: dict, context: dict) -> dict:
@@ -36,8 +48,8 @@ def handler(event: dict, context: dict) -> dict:
     request_type = event["RequestType"]
     props = event["ResourceProperties"]
 
-    logger.info(f"Request type: {request_type}")
-    logger.info(f"Provider name: {props['ProviderName']}")
+    logger.info("Request type: %s", request_type)
+    logger.info("Provider name: %s", props["ProviderName"])
 
     try:
         if request_type == "Create":
@@ -50,7 +62,7 @@ def handler(event: dict, context: dict) -> dict:
             raise ValueError(f"Unknown request type: {request_type}")
 
     except Exception as e:
-        logger.error(f"Error handling {request_type}: {str(e)}", exc_info=True)
+        logger.error("Error handling %s: %s", request_type, e, exc_info=True)
         raise
 
 
@@ -66,13 +78,13 @@ def handle_create(props: dict) -> dict:
     """
     # Retrieve client secret from Secrets Manager (not logged)
     secret_arn = props["ClientSecretArn"]
-    logger.info(f"Retrieving secret from: {secret_arn}")
+    logger.info("Retrieving secret from: %s", secret_arn)
 
     secret_response = secrets_client.get_secret_value(SecretId=secret_arn)
     client_secret = secret_response["SecretString"]
 
     # Create OAuth2 Credential Provider
-    logger.info(f"Creating OAuth2 provider: {props['ProviderName']}")
+    logger.info("Creating OAuth2 provider: %s", props["ProviderName"])
 
     response = bedrock_client.create_oauth2_credential_provider(
         name=props["ProviderName"],
@@ -87,7 +99,7 @@ def handle_create(props: dict) -> dict:
     )
 
     provider_arn = response["credentialProviderArn"]
-    logger.info(f"Created provider with ARN: {provider_arn}")
+    logger.info("Created provider with ARN: %s", provider_arn)
 
     return {
         "PhysicalResourceId": props["ProviderName"],
@@ -107,11 +119,11 @@ def handle_update(event: dict, props: dict) -> dict:
         Response with PhysicalResourceId and provider ARN
     """
     provider_name = event["PhysicalResourceId"]
-    logger.info(f"Updating OAuth2 provider: {provider_name}")
+    logger.info("Updating OAuth2 provider: %s", provider_name)
 
     # Retrieve client secret from Secrets Manager
     secret_arn = props["ClientSecretArn"]
-    logger.info(f"Retrieving secret from: {secret_arn}")
+    logger.info("Retrieving secret from: %s", secret_arn)
 
     secret_response = secrets_client.get_secret_value(SecretId=secret_arn)
     client_secret = secret_response["SecretString"]
@@ -130,7 +142,7 @@ def handle_update(event: dict, props: dict) -> dict:
     )
 
     provider_arn = response["credentialProviderArn"]
-    logger.info(f"Updated provider with ARN: {provider_arn}")
+    logger.info("Updated provider with ARN: %s", provider_arn)
 
     return {
         "PhysicalResourceId": provider_name,
@@ -150,15 +162,15 @@ def handle_delete(event: dict, props: dict) -> dict:
         Response with PhysicalResourceId
     """
     provider_name = event["PhysicalResourceId"]
-    logger.info(f"Deleting OAuth2 provider: {provider_name}")
+    logger.info("Deleting OAuth2 provider: %s", provider_name)
 
     try:
         bedrock_client.delete_oauth2_credential_provider(name=provider_name)
-        logger.info(f"Deleted provider: {provider_name}")
+        logger.info("Deleted provider: %s", provider_name)
     except bedrock_client.exceptions.ResourceNotFoundException:
-        logger.warning(f"Provider not found (already deleted): {provider_name}")
+        logger.warning("Provider not found (already deleted): %s", provider_name)
     except Exception as e:
-        logger.error(f"Error deleting provider: {str(e)}")
+        logger.error("Error deleting provider: %s", e)
         raise
 
     return {"PhysicalResourceId": provider_name}
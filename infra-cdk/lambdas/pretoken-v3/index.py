@@ -37,6 +37,14 @@ To use dynamic group assignment, replace the hardcoded mapping below with a
 DynamoDB table keyed by the user's sub (UUID). See docs/IDENTITY_POLICY.md.
 """
 
+import logging
+import os
+
+logger = logging.getLogger()
+# Fall back to INFO for unknown LOG_LEVEL values rather than failing Lambda init
+_log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
+
 # ============================================================================
 # USER-TO-GROUP MAPPING
 # ============================================================================
@@ -70,11 +78,11 @@ def lambda_handler(event: dict, context: dict) -> dict:
     Returns:
         Modified event with user identity claims injected into the M2M access token.
     """
-    print(f"[PRE-TOKEN] Trigger source: {event.get('triggerSource')}")
+    logger.debug("[PRE-TOKEN] Trigger source: %s", event.get("triggerSource"))
 
     # Only process M2M flows (Client Credentials grant)
     if event["triggerSource"] != "TokenGeneration_ClientCredentials":
-        print("[PRE-TOKEN] Not a Client Credentials flow - skipping")
+        logger.debug("[PRE-TOKEN] Not a Client Credentials flow - skipping")
         return event
 
     # Read the verified user_id (Cognito sub / UUID) from clientMetadata.
@@ -83,10 +91,10 @@ def lambda_handler(event: dict, context: dict) -> dict:
     user_id = meta.get("verified_user_id", "")
 
     if not user_id:
-        print("[PRE-TOKEN] No verified_user_id in metadata")
+        logger.warning("[PRE-TOKEN] No verified_user_id in metadata")
         return event
 
-    print("[PRE-TOKEN] Processing M2M token - verified_user_id received")
+    logger.debug("[PRE-TOKEN] Processing M2M token - verified_user_id received")
 
     # Look up department/role from the UUID mapping.
     # If the user's sub is not in the map, they get the default group (guest/viewer).
@@ -95,7 +103,7 @@ def lambda_handler(event: dict, context: dict) -> dict:
     group = USER_ROLE_MAP.get(user_id, DEFAULT_GROUP)
     department = group["department"]
     role = group["role"]
-    print(f"[PRE-TOKEN] Assigned: department={department}, role={role}")
+    logger.info("[PRE-TOKEN] Assigned: department=%s, role=%s", department, role)
 
     # Inject CUSTOM claims into the M2M Access Token.
     # At the AgentCore Gateway, the JWT Authorizer maps ALL token claims
@@ -116,5 +124,5 @@ def lambda_handler(event: dict, context: dict) -> dict:
         }
     }
 
-    print("[PRE-TOKEN] Claims injected successfully")
+    logger.debug("[PRE-TOKEN] Claims injected successfully")
     return event
@@ -24,11 +24,10 @@ To switch to Approach 2:
 """
 
 import logging
-import os
 
 from langchain_mcp_adapters.client import MultiServerMCPClient
-from utils.auth import get_gateway_access_token
-from utils.ssm import get_ssm_parameter
+from utils.auth import get_gateway_access_token_cached
+from utils.ssm import get_ssm_parameter, get_stack_name
 
 logger = logging.getLogger(__name__)
 
@@ -39,26 +38,23 @@ logger = logging.getLogger(__name__)
 async def create_gateway_mcp_client(user_id: str) -> MultiServerMCPClient:
     """Create MCP client for AgentCore Gateway with user identity propagation.
 
-    The user_id is passed to get_gateway_access_token() which includes it as
+    The user_id is passed to get_gateway_access_token_cached() which includes it as
     aws_client_metadata[verified_user_id] in the Cognito token request. The V3
     Pre-Token Lambda reads this to inject user-specific claims into the M2M token,
     enabling Cedar policy evaluation at the Gateway.
 
-    This function is called per-request, ensuring fresh tokens for each request.
+    Tokens are cached per user and refreshed well before they expire, so each
+    client is created with a valid token without a Cognito round trip per request.
 
     Args:
         user_id (str): The authenticated user's ID for identity propagation.
     """
-    stack_name = os.environ.get("STACK_NAME")
-    if not stack_name:
-        raise ValueError("STACK_NAME environment variable is required")
-    if not stack_name.replace("-", "").replace("_", "").isalnum():
-        raise ValueError("Invalid STACK_NAME format")
+    stack_name = get_stack_name()
 
     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
     logger.info("[GATEWAY] URL: %s", gateway_url)
 
-    fresh_token = get_gateway_access_token(user_id)
+    fresh_token = get_gateway_access_token_cached(user_id)
 
     return MultiServerMCPClient(
         {
@@ -74,6 +70,8 @@ async def create_gateway_mcp_client(user_id: str) -> MultiServerMCPClient:
 # ========================================
 # APPROACH 2 (Commented out): @requires_access_token decorator
 # ========================================
+# import os
+#
 # from bedrock_agentcore.identity.auth import requires_access_token
 #
 # @requires_access_token(
@@ -96,11 +94,7 @@ async def create_gateway_mcp_client(user_id: str) -> MultiServerMCPClient:
 #     No user identity propagation — the M2M token carries only machine credentials.
 #     Uses the @requires_access_token decorator for automatic token management.
 #     """
-#     stack_name = os.environ.get("STACK_NAME")
-#     if not stack_name:
-#         raise ValueError("STACK_NAME environment variable is required")
-#     if not stack_name.replace("-", "").replace("_", "").isalnum():
-#         raise ValueError("Invalid STACK_NAME format")
+#     stack_name = get_stack_name()
 #
 #     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
 #     logger.info("[GATEWAY] URL: %s", gateway_url)
@@ -24,12 +24,11 @@ To switch to Approach 2:
 """
 
 import logging
-import os
 
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp import MCPClient
-from utils.auth import get_gateway_access_token
-from utils.ssm import get_ssm_parameter
+from utils.auth import get_gateway_access_token_cached
+from utils.ssm import get_ssm_parameter, get_stack_name
 
 logger = logging.getLogger(__name__)
 
@@ -40,22 +39,19 @@ logger = logging.getLogger(__name__)
 def create_gateway_mcp_client(user_id: str) -> MCPClient:
     """Create MCP client for AgentCore Gateway with user identity propagation.
 
-    The user_id is passed to get_gateway_access_token() which includes it as
+    The user_id is passed to get_gateway_access_token_cached() which includes it as
     aws_client_metadata[verified_user_id] in the Cognito token request. The V3
     Pre-Token Lambda reads this to inject user-specific claims into the M2M token,
     enabling Cedar policy evaluation at the Gateway.
 
-    The token fetch is called INSIDE the lambda factory to ensure a fresh token
-    on every MCP reconnection, preventing stale token errors.
+    The token fetch is called INSIDE the lambda factory so every MCP reconnection
+    gets a valid token. Tokens are cached per user and refreshed well before they
+    expire, so reconnects do not pay a Cognito round trip each time.
 
     Args:
         user_id (str): The authenticated user's ID for identity propagation.
     """
-    stack_name = os.environ.get("STACK_NAME")
-    if not stack_name:
-        raise ValueError("STACK_NAME environment variable is required")
-    if not stack_name.replace("-", "").replace("_", "").isalnum():
-        raise ValueError("Invalid STACK_NAME format")
+    stack_name = get_stack_name()
 
     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
     logger.info("[GATEWAY] URL: %s", gateway_url)
@@ -63,7 +59,9 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
     return MCPClient(
         lambda: streamablehttp_client(
             url=gateway_url,
-            headers={"Authorization": f"Bearer {get_gateway_access_token(user_id)}"},
+            headers={
+                "Authorization": f"Bearer {get_gateway_access_token_cached(user_id)}"
+            },
         ),
         prefix="gateway",
     )
@@ -72,6 +70,8 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
 # ========================================
 # APPROACH 2 (Commented out): @requires_access_token decorator
 # ========================================
+# import os
+#
 # from bedrock_agentcore.identity.auth import requires_access_token
 #
 # @requires_access_token(
@@ -94,11 +94,7 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
 #     No user identity propagation — the M2M token carries only machine credentials.
 #     Uses the @requires_access_token decorator for automatic token management.
 #     """
-#     stack_name = os.environ.get("STACK_NAME")
-#     if not stack_name:
-#         raise ValueError("STACK_NAME environment variable is required")
-#     if not stack_name.replace("-", "").replace("_", "").isalnum():
-#         raise ValueError("Invalid STACK_NAME format")
+#     stack_name = get_stack_name()
 #
 #     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
 #     logger.info("[GATEWAY] URL: %s", gateway_url)
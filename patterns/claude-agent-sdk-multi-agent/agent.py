@@ -20,8 +20,11 @@ from claude_agent_sdk import (
     UserMessage,
 )
 from code_int_mcp.server import code_int_mcp_server
-from utils.auth import extract_user_id_from_context, get_gateway_access_token
-from utils.ssm import get_ssm_parameter
+from utils.auth import (
+    extract_user_id_from_context,
+    get_gateway_access_token_cached,
+)
+from utils.ssm import get_ssm_parameter, get_stack_name
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,16 +61,14 @@ async def main(payload, context: RequestContext):
     logger.info("[AGENT] User: %s, Session: %s", user_id, runtime_session_id)
 
     # Get Gateway URL and access token
-    stack_name = os.environ.get("STACK_NAME")
     gateway_url = None
     access_token = None
-    if stack_name:
-        # Validate stack name format to prevent SSM parameter path injection
-        if not stack_name.replace("-", "").replace("_", "").isalnum():
-            raise ValueError("Invalid STACK_NAME format")
+    if os.environ.get("STACK_NAME"):
+        # Validates the stack name format to prevent SSM parameter path injection
+        stack_name = get_stack_name()
         try:
             gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
-            access_token = get_gateway_access_token(user_id)
+            access_token = get_gateway_access_token_cached(user_id)
         except Exception as e:
             logger.warning(
                 "[AGENT] Gateway not available, continuing without tools: %s", e
@@ -52,9 +52,15 @@ class CodeInterpreterClient:
                 name=operation,
                 arguments=args if args else {},
             )
-            output = ""
+            # Only the last result is returned, so serialize just that one
+            last_event = None
             for event in response["stream"]:
-                output = json.dumps(event["result"], indent=2)
+                last_event = event
+            output = (
+                json.dumps(last_event["result"], separators=(",", ":"))
+                if last_event is not None
+                else ""
+            )
 
             execution_time = time.time() - start_time
 
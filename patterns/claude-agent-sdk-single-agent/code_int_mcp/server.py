@@ -27,7 +27,7 @@ async def execute_code(args: dict[str, Any]) -> dict[str, Any]:
         args.get("language", "python"),
         args.get("code_int_session_id", ""),
     )
-    response_text = result.model_dump_json(indent=2)
+    response_text = result.model_dump_json()
 
     return {"content": [{"type": "text", "text": response_text}]}
 
@@ -41,7 +41,7 @@ async def execute_command(args: dict[str, Any]) -> dict[str, Any]:
     result = client.execute_command(
         args.get("command"), args.get("code_int_session_id", "")
     )
-    response_text = result.model_dump_json(indent=2)
+    response_text = result.model_dump_json()
 
     return {"content": [{"type": "text", "text": response_text}]}
 
@@ -57,7 +57,7 @@ async def write_files(args: dict[str, Any]) -> dict[str, Any]:
         files_to_create = json.loads(files_to_create)
 
     result = client.write_files(files_to_create, args.get("code_int_session_id", ""))
-    response_text = result.model_dump_json(indent=2)
+    response_text = result.model_dump_json()
 
     return {"content": [{"type": "text", "text": response_text}]}
 
@@ -72,7 +72,7 @@ async def read_files(args: dict[str, Any]) -> dict[str, Any]:
     if isinstance(paths, str):
         paths = json.loads(paths)
     result = client.read_files(paths, args.get("code_int_session_id", ""))
-    response_text = result.model_dump_json(indent=2)
+    response_text = result.model_dump_json()
 
     return {"content": [{"type": "text", "text": response_text}]}
 
@@ -1,7 +1,10 @@
 """LangGraph agent with Gateway MCP tools, Memory, and Code Interpreter."""
 
+import functools
 import logging
 import os
+import time
+from typing import Any
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp, RequestContext
 from langchain.agents import create_agent
@@ -9,6 +12,7 @@ from langchain_aws import ChatBedrock
 from langgraph_checkpoint_aws import AgentCoreMemorySaver
 from tools.gateway import create_gateway_mcp_client
 from utils.auth import extract_user_id_from_context
+from utils.sessions import is_session_busy, session_lock
 
 from tools.code_interpreter import LangGraphCodeInterpreterTools
 
@@ -22,6 +26,9 @@ SYSTEM_PROMPT = (
 )
 
 
+# The model client and checkpointer only depend on container-lifetime configuration,
+# so they are built once and reused across warm invocations.
+@functools.lru_cache(maxsize=1)
 def _build_model() -> ChatBedrock:
     return ChatBedrock(
         model_id="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
@@ -31,6 +38,7 @@ def _build_model() -> ChatBedrock:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _create_checkpointer() -> AgentCoreMemorySaver:
     memory_id = os.environ.get("MEMORY_ID")
     if not memory_id:
@@ -41,13 +49,12 @@ def _create_checkpointer() -> AgentCoreMemorySaver:
     )
 
 
-async def create_langgraph_agent(user_id: str):
+async def create_langgraph_agent(
+    user_id: str, code_tools: LangGraphCodeInterpreterTools
+):
     """Create a LangGraph agent with Gateway tools, Memory, and Code Interpreter."""
     mcp_client = await create_gateway_mcp_client(user_id)
     tools = await mcp_client.get_tools()
-
-    region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    code_tools = LangGraphCodeInterpreterTools(region)
     tools.append(code_tools.execute_python_securely)
 
     return create_agent(
@@ -58,6 +65,59 @@ async def create_langgraph_agent(user_id: str):
     )
 
 
+# Building the agent lists the Gateway tools over MCP and compiles the graph, so
+# the compiled agent is reused across turns of a session for a short TTL. Entries
+# are keyed by user and session: each Gateway tool carries the user's
+# identity-propagated M2M token in its connection headers (the TTL is kept well
+# below the token lifetime), and the Code Interpreter sandbox keeps state between
+# executions, which must not leak across conversations.
+AGENT_CACHE_TTL_SECONDS = 300
+_agent_cache: dict[
+    tuple[str, str], tuple[float, Any, LangGraphCodeInterpreterTools]
+] = {}
+
+
+def _cleanup_code_tools(code_tools: LangGraphCodeInterpreterTools) -> None:
+    """Stop a dropped agent's Code Interpreter sandbox."""
+    try:
+        code_tools.cleanup()
+    except Exception:
+        logger.warning("Failed to clean up Code Interpreter session", exc_info=True)
+
+
+async def get_langgraph_agent(user_id: str, session_id: str):
+    """Return the session's LangGraph agent, reusing a cached one within the TTL.
+
+    Called under the session's lock, so a cached sandbox is never shared by
+    concurrent turns, and expired entries of sessions that are mid-turn are
+    kept until a later request.
+    """
+    key = (user_id, session_id)
+    now = time.monotonic()
+    cached = _agent_cache.get(key)
+    if cached and now - cached[0] < AGENT_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+    code_tools = LangGraphCodeInterpreterTools(region)
+    graph = await create_langgraph_agent(user_id, code_tools)
+
+    # Drop expired entries of idle sessions so the cache stays bounded by
+    # recently active sessions
+    for stale_key, (created_at, _, stale_tools) in list(_agent_cache.items()):
+        if stale_key == key or now - created_at < AGENT_CACHE_TTL_SECONDS:
+            continue
+        if not is_session_busy(*stale_key):
+            del _agent_cache[stale_key]
+            _cleanup_code_tools(stale_tools)
+
+    replaced = _agent_cache.pop(key, None)
+    if replaced is not None:
+        _cleanup_code_tools(replaced[2])
+    _agent_cache[key] = (now, graph, code_tools)
+    return graph
+
+
 @app.entrypoint
 async def invocations(payload, context: RequestContext):
     """Main entrypoint — called by AgentCore Runtime on each request."""
@@ -74,17 +134,20 @@ async def invocations(payload, context: RequestContext):
     try:
         user_id = extract_user_id_from_context(context)
 
-        graph = await create_langgraph_agent(user_id)
+        async with session_lock(user_id, session_id):
+            graph = await get_langgraph_agent(user_id, session_id)
 
-        config = {"configurable": {"thread_id": session_id, "actor_id": user_id}}
+            config = {"configurable": {"thread_id": session_id, "actor_id": user_id}}
 
-        async for event in graph.astream(
-            {"messages": [("user", user_query)]},
-            config=config,
-            stream_mode="messages",
-        ):
-            message_chunk, metadata = event
-            yield message_chunk.model_dump()
+            async for event in graph.astream(
+                {"messages": [("user", user_query)]},
+                config=config,
+                stream_mode="messages",
+            ):
+                message_chunk, metadata = event
+                # mode="json" yields JSON-native values so the runtime can encode
+                # each token in one pass; dropping None fields shrinks every SSE frame.
+                yield message_chunk.model_dump(mode="json", exclude_none=True)
 
     except Exception as e:
         error_msg = str(e) if str(e) else f"{type(e).__name__}: {repr(e)}"
@@ -1,8 +1,12 @@
 """Strands agent with Gateway MCP tools, Memory, and Code Interpreter."""
 
-import json
+import asyncio
 import logging
 import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any
 
 from bedrock_agentcore.memory.integrations.strands.config import (
     AgentCoreMemoryConfig,
@@ -14,20 +18,54 @@ from bedrock_agentcore.memory.integrations.strands.session_manager import (
 from bedrock_agentcore.runtime import BedrockAgentCoreApp, RequestContext
 from strands import Agent
 from strands.models import BedrockModel
-from tools.gateway import create_gateway_mcp_client
+from tools.gateway import create_gateway_mcp_client, prefetch_gateway_config
 from utils.auth import extract_user_id_from_context
+from utils.sessions import is_session_busy, session_lock
 
 from tools.code_interpreter import StrandsCodeInterpreterTools
 
 logger = logging.getLogger(__name__)
 
-app = BedrockAgentCoreApp()
+
+def _log_warm_up_failure(task: asyncio.Task) -> None:
+    """Log a failed warm-up; requests fall back to fetching the config lazily."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Gateway config warm-up failed", exc_info=task.exception())
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    """Warm Gateway configuration caches in the background at startup.
+
+    The warm-up runs as a task so the server starts serving (including /ping)
+    immediately; a slow or unreachable SSM only delays the cache fill, and
+    requests that arrive first do the lookups themselves.
+    """
+    warm_up = asyncio.create_task(asyncio.to_thread(prefetch_gateway_config))
+    warm_up.add_done_callback(_log_warm_up_failure)
+    yield
+    warm_up.cancel()
+
+
+app = BedrockAgentCoreApp(lifespan=lifespan)
 
 SYSTEM_PROMPT = (
     "You are a helpful assistant with access to tools via the Gateway and Code Interpreter. "
     "When asked about your tools, list them and explain what they do."
 )
 
+# Configuration that does not change per request is read once at import
+REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+MEMORY_ID = os.environ.get("MEMORY_ID")
+USE_LONG_TERM_MEMORY = os.environ.get("USE_LONG_TERM_MEMORY", "false").lower() == "true"
+LTM_TOP_K = int(os.environ.get("LTM_TOP_K", "10"))
+LTM_RELEVANCE_SCORE = float(os.environ.get("LTM_RELEVANCE_SCORE", "0.3"))
+
+# The model is stateless across conversations, so all agents share one instance
+MODEL = BedrockModel(
+    model_id="us.anthropic.claude-sonnet-4-5-20250929-v1:0", temperature=0.1
+)
+
 
 def _create_session_manager(
     user_id: str, session_id: str
@@ -46,65 +84,172 @@ def _create_session_manager(
     Returns:
         An AgentCoreMemorySessionManager bound to the user and session.
     """
-    memory_id = os.environ.get("MEMORY_ID")
-    if not memory_id:
+    if not MEMORY_ID:
         raise ValueError("MEMORY_ID environment variable is required")
 
-    use_ltm = os.environ.get("USE_LONG_TERM_MEMORY", "false").lower() == "true"
-
-    top_k = int(os.environ.get("LTM_TOP_K", "10"))
-    relevance_score = float(os.environ.get("LTM_RELEVANCE_SCORE", "0.3"))
-
     # Only pass retrieval_config when LTM is explicitly enabled.
     # Omitting it means the session manager uses short-term memory only,
     # which avoids the $0.50/1,000 retrieval and $0.75/1,000 storage costs.
     retrieval_config = (
         {
             "/facts/{actorId}": RetrievalConfig(
-                top_k=top_k,
-                relevance_score=relevance_score,
+                top_k=LTM_TOP_K,
+                relevance_score=LTM_RELEVANCE_SCORE,
             )
         }
-        if use_ltm
+        if USE_LONG_TERM_MEMORY
         else None
     )
 
     config = AgentCoreMemoryConfig(
-        memory_id=memory_id,
+        memory_id=MEMORY_ID,
         session_id=session_id,
         actor_id=user_id,
         retrieval_config=retrieval_config,
     )
     return AgentCoreMemorySessionManager(
         agentcore_memory_config=config,
-        region_name=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+        region_name=REGION,
     )
 
 
-def create_strands_agent(user_id: str, session_id: str) -> Agent:
+def create_strands_agent(
+    user_id: str, session_id: str, code_tools: StrandsCodeInterpreterTools
+) -> Agent:
     """Create a Strands agent with Gateway tools, memory, and Code Interpreter."""
-
-    bedrock_model = BedrockModel(
-        model_id="us.anthropic.claude-sonnet-4-5-20250929-v1:0", temperature=0.1
-    )
-
     session_manager = _create_session_manager(user_id, session_id)
 
-    region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    code_tools = StrandsCodeInterpreterTools(region)
-
     gateway_client = create_gateway_mcp_client(user_id)
 
     return Agent(
         name="strands_agent",
         system_prompt=SYSTEM_PROMPT,
         tools=[gateway_client, code_tools.execute_python_securely],
-        model=bedrock_model,
+        model=MODEL,
         session_manager=session_manager,
         trace_attributes={"user.id": user_id, "session.id": session_id},
     )
 
 
+# Agents are reused across turns of the same session so follow-up messages skip the
+# MCP handshake, Gateway token fetch and memory session setup. Entries expire after
+# a TTL (well below the Gateway token lifetime) and the least recently used agents
+# are evicted once the cache is full. A Strands Agent runs one invocation at a time,
+# so turns for the same session (e.g. a client retry while a response is still
+# streaming) wait on the session's lock from utils.sessions.
+AGENT_CACHE_TTL_SECONDS = 600
+AGENT_CACHE_MAX_SIZE = 256
+_agent_cache: OrderedDict[
+    tuple[str, str], tuple[Agent, StrandsCodeInterpreterTools, float]
+] = OrderedDict()
+
+
+def _cleanup_agent(agent: Agent, code_tools: StrandsCodeInterpreterTools) -> None:
+    """Stop an evicted agent's Gateway MCP client and Code Interpreter sandbox."""
+    try:
+        agent.cleanup()
+    except Exception:
+        logger.warning("Failed to clean up evicted agent", exc_info=True)
+    try:
+        code_tools.cleanup()
+    except Exception:
+        logger.warning("Failed to clean up Code Interpreter session", exc_info=True)
+
+
+def get_or_create_agent(user_id: str, session_id: str) -> Agent:
+    """Return the cached agent for this user and session, creating one if needed.
+
+    Called under the session's lock. When the cache is full, the least recently
+    used agents of idle sessions are evicted; agents that are mid-turn are
+    never cleaned up.
+    """
+    key = (user_id, session_id)
+    now = time.monotonic()
+
+    cached = _agent_cache.pop(key, None)
+    if cached is not None:
+        agent, code_tools, created_at = cached
+        if now - created_at < AGENT_CACHE_TTL_SECONDS:
+            _agent_cache[key] = cached
+            return agent
+        _cleanup_agent(agent, code_tools)
+
+    code_tools = StrandsCodeInterpreterTools(REGION)
+    agent = create_strands_agent(user_id, session_id, code_tools)
+    _agent_cache[key] = (agent, code_tools, now)
+    for stale_key in list(_agent_cache):
+        if len(_agent_cache) <= AGENT_CACHE_MAX_SIZE:
+            break
+        if is_session_busy(*stale_key):
+            continue
+        evicted, evicted_tools, _ = _agent_cache.pop(stale_key)
+        _cleanup_agent(evicted, evicted_tools)
+    return agent
+
+
+def evict_agent(user_id: str, session_id: str) -> None:
+    """Drop a cached agent so the next request rebuilds it from scratch."""
+    cached = _agent_cache.pop((user_id, session_id), None)
+    if cached is not None:
+        _cleanup_agent(cached[0], cached[1])
+
+
+# Invocation state that Strands (1.32) merges into many stream events: the agent
+# object, request state, event loop cycle IDs and tracing spans. None of it is
+# part of the event contract clients read, so it is dropped instead of being
+# converted on every token. All other event keys are forwarded unchanged.
+INVOCATION_STATE_KEYS = frozenset(
+    {
+        "agent",
+        "request_state",
+        "event_loop_cycle_id",
+        "event_loop_parent_cycle_id",
+        "event_loop_cycle_trace",
+        "event_loop_cycle_span",
+    }
+)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# How json.dumps spells the non-string dict keys whose str() differs
+_JSON_KEY_LITERALS = {True: "true", False: "false", None: "null"}
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key to the string json.dumps would use for it."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool):
+        return _JSON_KEY_LITERALS[key]
+    return str(key)
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert a streamed event value into JSON-serializable data.
+
+    Matches json.loads(json.dumps(value, default=str)) without the
+    serialize/parse round trip: containers are walked, JSON scalars are kept
+    as-is and any other object is stringified. Unlike json.dumps, dict keys
+    of non-JSON types (e.g. tuples) are stringified instead of raising.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {_json_key(key): _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(item) for item in value]
+    return str(value)
+
+
+def _event_payload(event: dict[str, Any]) -> dict[str, Any]:
+    """Build the JSON payload for a stream event, without the invocation state."""
+    return {
+        key: _to_jsonable(value)
+        for key, value in event.items()
+        if key not in INVOCATION_STATE_KEYS
+    }
+
+
 @app.entrypoint
 async def invocations(payload, context: RequestContext):
     """Main entrypoint — called by AgentCore Runtime on each request.
@@ -124,10 +269,19 @@ async def invocations(payload, context: RequestContext):
 
     try:
         user_id = extract_user_id_from_context(context)
-        agent = create_strands_agent(user_id, session_id)
 
-        async for event in agent.stream_async(user_query):
-            yield json.loads(json.dumps(dict(event), default=str))
+        async with session_lock(user_id, session_id):
+            try:
+                agent = get_or_create_agent(user_id, session_id)
+
+                async for event in agent.stream_async(user_query):
+                    yield _event_payload(event)
+            except Exception:
+                # Rebuild on the next turn in case the failure left the agent or
+                # its MCP session in a bad state. Holding the session lock means
+                # no other turn is using this agent.
+                evict_agent(user_id, session_id)
+                raise
 
     except Exception as e:
         logger.exception("Agent run failed")
@@ -135,4 +289,13 @@ async def invocations(payload, context: RequestContext):
 
 
 if __name__ == "__main__":
+    # The runtime streams async-generator entrypoints on its own worker loop,
+    # created with asyncio.new_event_loop(), so uvloop has to be installed as
+    # the global policy to take effect there.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     app.run()
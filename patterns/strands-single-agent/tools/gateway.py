@@ -24,15 +24,56 @@ To switch to Approach 2:
 """
 
 import logging
-import os
 
+import httpx
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp import MCPClient
-from utils.auth import get_gateway_access_token
-from utils.ssm import get_ssm_parameter
+from utils.auth import get_gateway_access_token_cached
+from utils.clients import get_client
+from utils.ssm import get_ssm_parameter, get_stack_name
 
 logger = logging.getLogger(__name__)
 
+# httpx drops idle connections after 5 seconds by default, which is shorter
+# than a typical model turn between tool calls, so each call would open a new
+# TLS connection to the Gateway. Keep idle connections around for a minute.
+GATEWAY_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
+
+def prefetch_gateway_config() -> None:
+    """Warm the caches used to connect to the Gateway before the first request.
+
+    Loads the Gateway URL and Cognito client configuration into the SSM
+    parameter cache and creates the shared AWS clients, so the first user
+    request does not pay for those lookups. The access token itself is
+    user-specific and is still fetched on demand.
+    """
+    stack_name = get_stack_name()
+    for name in ("gateway_url", "cognito_provider", "machine_client_id"):
+        get_ssm_parameter(f"/{stack_name}/{name}")
+    get_client("secretsmanager")
+
+
+def _create_gateway_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """httpx client factory for the MCP transport with longer-lived keep-alive.
+
+    Mirrors the MCP SDK's default factory (redirects followed, 30s timeout with
+    a 300s read timeout for the SSE stream) and adds GATEWAY_HTTP_LIMITS.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0, read=300.0),
+        auth=auth,
+        follow_redirects=True,
+        limits=GATEWAY_HTTP_LIMITS,
+    )
+
 
 # ========================================
 # APPROACH 1 (Active): Direct Cognito call with user identity
@@ -40,22 +81,19 @@ logger = logging.getLogger(__name__)
 def create_gateway_mcp_client(user_id: str) -> MCPClient:
     """Create MCP client for AgentCore Gateway with user identity propagation.
 
-    The user_id is passed to get_gateway_access_token() which includes it as
+    The user_id is passed to get_gateway_access_token_cached() which includes it as
     aws_client_metadata[verified_user_id] in the Cognito token request. The V3
     Pre-Token Lambda reads this to inject user-specific claims into the M2M token,
     enabling Cedar policy evaluation at the Gateway.
 
-    The token fetch is called INSIDE the lambda factory to ensure a fresh token
-    on every MCP reconnection, preventing stale token errors.
+    The token fetch is called INSIDE the lambda factory so every MCP reconnection
+    gets a valid token. Tokens are cached per user and refreshed well before they
+    expire, so reconnects do not pay a Cognito round trip each time.
 
     Args:
         user_id (str): The authenticated user's ID for identity propagation.
     """
-    stack_name = os.environ.get("STACK_NAME")
-    if not stack_name:
-        raise ValueError("STACK_NAME environment variable is required")
-    if not stack_name.replace("-", "").replace("_", "").isalnum():
-        raise ValueError("Invalid STACK_NAME format")
+    stack_name = get_stack_name()
 
     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
     logger.info("[GATEWAY] URL: %s", gateway_url)
@@ -63,7 +101,10 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
     return MCPClient(
         lambda: streamablehttp_client(
             url=gateway_url,
-            headers={"Authorization": f"Bearer {get_gateway_access_token(user_id)}"},
+            headers={
+                "Authorization": f"Bearer {get_gateway_access_token_cached(user_id)}"
+            },
+            httpx_client_factory=_create_gateway_http_client,
         ),
         prefix="gateway",
     )
@@ -72,6 +113,8 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
 # ========================================
 # APPROACH 2 (Commented out): @requires_access_token decorator
 # ========================================
+# import os
+#
 # from bedrock_agentcore.identity.auth import requires_access_token
 #
 # @requires_access_token(
@@ -101,11 +144,7 @@ def create_gateway_mcp_client(user_id: str) -> MCPClient:
 #     No user identity propagation — the M2M token carries only machine credentials.
 #     Uses the @requires_access_token decorator for automatic token management.
 #     """
-#     stack_name = os.environ.get("STACK_NAME")
-#     if not stack_name:
-#         raise ValueError("STACK_NAME environment variable is required")
-#     if not stack_name.replace("-", "").replace("_", "").isalnum():
-#         raise ValueError("Invalid STACK_NAME format")
+#     stack_name = get_stack_name()
 #
 #     gateway_url = get_ssm_parameter(f"/{stack_name}/gateway_url")
 #     logger.info("[GATEWAY] URL: %s", gateway_url)
@@ -7,23 +7,49 @@ Provides:
 - OAuth2 client credentials flow for machine-to-machine Gateway authentication,
   with user identity propagation via aws_client_metadata for Cognito V3
   Pre-Token Lambda enrichment.
+- A per-user access token cache that reuses Gateway tokens across MCP
+  (re)connections and refreshes them well before they expire.
 """
 
 import base64
+import functools
 import json
 import logging
 import os
+import random
+import threading
+import time
 
-import boto3
 import jwt
 import requests
 from bedrock_agentcore.runtime import RequestContext
 
+from utils.clients import get_client, get_region
 from utils.ssm import get_ssm_parameter
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _decode_user_id(token: str) -> str | None:
+    """
+    Return the 'sub' claim of a JWT, memoized per token.
+
+    The same token is presented on every turn of a session, so repeated
+    requests skip the base64 and JSON decoding. Rotated tokens age out of
+    the bounded LRU.
+    """
+    # Decode without signature verification — AgentCore Runtime already validated the token.
+    # We use options to skip all verification since this is a trusted, pre-validated token.
+    claims = jwt.decode(  # nosec B105
+        jwt=token,
+        # nosemgrep: python.jwt.security.unverified-jwt-decode.unverified-jwt-decode — signature verification intentionally skipped; AgentCore Runtime already validated the JWT
+        options={"verify_signature": False},
+        algorithms=["RS256"],
+    )
+    return claims.get("sub")
+
+
 def extract_user_id_from_context(context: RequestContext) -> str:
     """
     Securely extract the user ID from the JWT token in the request context.
@@ -62,22 +88,9 @@ def extract_user_id_from_context(context: RequestContext) -> str:
         )
 
     # Remove "Bearer " prefix to get the raw JWT token
-    token = (
-        auth_header.replace("Bearer ", "")
-        if auth_header.startswith("Bearer ")
-        else auth_header
-    )
-
-    # Decode without signature verification — AgentCore Runtime already validated the token.
-    # We use options to skip all verification since this is a trusted, pre-validated token.
-    claims = jwt.decode(  # nosec B105
-        jwt=token,
-        # nosemgrep: python.jwt.security.unverified-jwt-decode.unverified-jwt-decode — signature verification intentionally skipped; AgentCore Runtime already validated the JWT
-        options={"verify_signature": False},
-        algorithms=["RS256"],
-    )
+    token = auth_header.removeprefix("Bearer ")
 
-    user_id = claims.get("sub")
+    user_id = _decode_user_id(token)
     if not user_id:
         raise ValueError(
             "JWT token does not contain a 'sub' claim. Cannot determine user identity."
@@ -101,10 +114,7 @@ def get_secret(secret_name: str) -> str:
         ValueError: If the secret is not found or cannot be accessed.
         RuntimeError: If there's an AWS service error.
     """
-    region = os.environ.get(
-        "AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    )
-    secrets_client = boto3.client("secretsmanager", region_name=region)
+    secrets_client = get_client("secretsmanager")
 
     try:
         response = secrets_client.get_secret_value(SecretId=secret_name)
@@ -127,6 +137,20 @@ def get_secret(secret_name: str) -> str:
         )
 
 
+TOKEN_REQUEST_MAX_ATTEMPTS = 3
+
+# (connect, read) timeout per attempt. Some callers run on the event loop, so
+# all attempts together must stay close to the original single 30s request.
+TOKEN_REQUEST_TIMEOUT = (3, 7)
+
+# Cached tokens are handed out only while they have at least this much lifetime
+# left, so long-lived MCP sessions built from them never outlive the token.
+TOKEN_REFRESH_MARGIN_SECONDS = 1800
+
+_token_cache: dict[str, tuple[str, float]] = {}
+_token_cache_lock = threading.Lock()
+
+
 def get_gateway_access_token(user_id: str) -> str:
     """
     Get an OAuth2 access token using the client credentials flow, with user
@@ -154,9 +178,7 @@ def get_gateway_access_token(user_id: str) -> str:
         Exception: If the token request fails or the response is invalid.
     """
     stack_name = os.environ["STACK_NAME"]
-    region = os.environ.get(
-        "AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    )
+    region = get_region()
 
     logger.info(
         "Getting access token for stack: %s, region: %s", stack_name, region
@@ -198,8 +220,28 @@ def get_gateway_access_token(user_id: str) -> str:
     )  # nosemgrep: python.lang.security.audit.logging.logger-credential-leak.python-logger-credential-disclosure
     logger.info("Scopes: %s", data["scope"])
 
-    # Request access token from Cognito
-    response = requests.post(url=token_url, headers=headers, data=data, timeout=30)
+    # Request access token from Cognito, retrying transient failures with
+    # exponential backoff and jitter. Client errors (4xx other than 429) are
+    # permanent and fail fast.
+    for attempt in range(1, TOKEN_REQUEST_MAX_ATTEMPTS + 1):
+        try:
+            response = requests.post(
+                url=token_url, headers=headers, data=data, timeout=TOKEN_REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            if attempt == TOKEN_REQUEST_MAX_ATTEMPTS:
+                raise
+            logger.warning("Token request error (attempt %d): %s", attempt, e)
+        else:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == TOKEN_REQUEST_MAX_ATTEMPTS:
+                break
+            logger.warning(
+                "Token request failed with %s (attempt %d)",
+                response.status_code,
+                attempt,
+            )  # nosemgrep: python.lang.security.audit.logging.logger-credential-leak.python-logger-credential-disclosure
+        time.sleep(2 ** (attempt - 1) * 0.5 * random.uniform(0.5, 1.5))  # nosec B311
 
     if response.status_code != 200:
         logger.error(
@@ -219,3 +261,43 @@ def get_gateway_access_token(user_id: str) -> str:
 
     logger.info("Successfully got access token")
     return access_token
+
+
+def get_gateway_access_token_cached(user_id: str) -> str:
+    """
+    Get a Gateway access token for the user, reusing a cached token while it
+    has more than TOKEN_REFRESH_MARGIN_SECONDS of lifetime left.
+
+    Tokens carry user-specific claims, so the cache is keyed by user_id. The
+    expiry is read from the token's 'exp' claim without verifying the
+    signature; the token was just issued by Cognito and is only inspected
+    locally. Safe to call from MCP client factories running on background
+    threads.
+
+    Args:
+        user_id (str): The authenticated user's ID (sub claim from validated JWT).
+
+    Returns:
+        str: A valid OAuth2 access token for Gateway authentication.
+    """
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(user_id)
+    if cached and cached[1] - now > TOKEN_REFRESH_MARGIN_SECONDS:
+        return cached[0]
+
+    access_token = get_gateway_access_token(user_id)
+    claims = jwt.decode(  # nosec B105
+        jwt=access_token,
+        # nosemgrep: python.jwt.security.unverified-jwt-decode.unverified-jwt-decode — only the exp claim is read to schedule a refresh
+        options={"verify_signature": False},
+        algorithms=["RS256"],
+    )
+    expires_at = float(claims.get("exp", 0))
+
+    with _token_cache_lock:
+        # Drop expired tokens so the cache stays bounded by active users
+        for key in [k for k, (_, exp) in _token_cache.items() if exp <= now]:
+            del _token_cache[key]
+        _token_cache[user_id] = (access_token, expires_at)
+    return access_token
@@ -0,0 +1,45 @@
+"""
+Shared boto3 client factory for agent patterns.
+
+Creating a boto3 client resolves credentials and endpoints and allocates a
+new HTTPS connection pool, so agents reuse one client per service for the
+lifetime of the Runtime container instead of building one per call.
+"""
+
+import functools
+import os
+
+import boto3
+from botocore.config import Config
+
+# Sized for several agents sharing a client concurrently
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+
+def get_region() -> str:
+    """Return the AWS region the agent runs in."""
+    return os.environ.get(
+        "AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str):
+    """
+    Get a shared boto3 client for the given service.
+
+    Clients are created from their own boto3 Session (the default session is
+    not thread-safe) and cached, so every caller in the container shares the
+    same connection pool.
+
+    Args:
+        service_name (str): The AWS service name (e.g. 'ssm', 'secretsmanager').
+
+    Returns:
+        A boto3 client for the service in the agent's region.
+    """
+    session = boto3.session.Session(region_name=get_region())
+    return session.client(service_name, config=BOTO_CONFIG)
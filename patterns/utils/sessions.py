@@ -0,0 +1,52 @@
+"""
+Per-session turn locking for agent patterns.
+
+Agents that are cached across turns of a conversation can only run one turn
+at a time, and their resources must not be released while a turn is using
+them. Each (user_id, session_id) pair gets an asyncio.Lock that requests hold
+for the duration of a turn. Locks live in a weak-value dictionary, so a lock
+exists only while some request holds or waits on it.
+"""
+
+import asyncio
+import weakref
+
+_session_locks: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def session_lock(user_id: str, session_id: str) -> asyncio.Lock:
+    """
+    Get the lock that serializes turns for a user's session.
+
+    Args:
+        user_id (str): The authenticated user's ID.
+        session_id (str): The runtime session ID.
+
+    Returns:
+        asyncio.Lock: The session's lock, shared by all concurrent requests.
+    """
+    key = (user_id, session_id)
+    lock = _session_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[key] = lock
+    return lock
+
+
+def is_session_busy(user_id: str, session_id: str) -> bool:
+    """
+    Check whether a turn is currently running for a user's session.
+
+    Caches use this to avoid releasing an agent's resources mid-turn.
+
+    Args:
+        user_id (str): The authenticated user's ID.
+        session_id (str): The runtime session ID.
+
+    Returns:
+        bool: True if the session's lock is held.
+    """
+    lock = _session_locks.get((user_id, session_id))
+    return lock is not None and lock.locked()
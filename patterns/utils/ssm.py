@@ -3,16 +3,55 @@ SSM Parameter Store utilities for agent patterns.
 
 Provides a single shared function for fetching parameters from AWS SSM
 Parameter Store, used by agents to retrieve configuration values like
-Gateway URLs that are set during deployment.
+Gateway URLs that are set during deployment, and a validated accessor for
+the STACK_NAME that prefixes those parameter paths.
+
+Values are cached in memory for a short TTL. They are written at deploy time
+and rarely change, so warm invocations skip the GetParameter round trip while
+rotated values are still picked up within minutes.
 """
 
+import functools
 import logging
 import os
+import re
+import time
 
-import boto3
+from utils.clients import get_client
 
 logger = logging.getLogger(__name__)
 
+SSM_CACHE_TTL_SECONDS = 600
+
+_parameter_cache: dict[str, tuple[str, float]] = {}
+
+# Stack names are used in SSM parameter paths, so only allow letters, digits, - and _
+_STACK_NAME_RE = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+
+
+@functools.lru_cache(maxsize=1)
+def get_stack_name() -> str:
+    """
+    Return the STACK_NAME environment variable, validated for use in SSM paths.
+
+    Validating the format prevents SSM parameter path injection. Environment
+    variables are fixed for the lifetime of the Runtime container, so the
+    validated value is cached after the first successful call.
+
+    Returns:
+        str: The stack name.
+
+    Raises:
+        ValueError: If STACK_NAME is not set or contains characters other than
+            letters, digits, '-' and '_'.
+    """
+    stack_name = os.environ.get("STACK_NAME")
+    if not stack_name:
+        raise ValueError("STACK_NAME environment variable is required")
+    if not _STACK_NAME_RE.match(stack_name):
+        raise ValueError("Invalid STACK_NAME format")
+    return stack_name
+
 
 def get_ssm_parameter(parameter_name: str) -> str:
     """
@@ -21,6 +60,7 @@ def get_ssm_parameter(parameter_name: str) -> str:
     SSM Parameter Store is AWS's service for storing configuration values
     securely. This function retrieves values like Gateway URLs and other
     stack-specific configuration that are set during CDK deployment.
+    Values are reused for SSM_CACHE_TTL_SECONDS before being fetched again.
 
     Args:
         parameter_name (str): The full SSM parameter name/path
@@ -32,13 +72,17 @@ def get_ssm_parameter(parameter_name: str) -> str:
     Raises:
         ValueError: If the parameter is not found or cannot be retrieved.
     """
-    region = os.environ.get(
-        "AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    )
-    ssm = boto3.client("ssm", region_name=region)
+    now = time.monotonic()
+    cached = _parameter_cache.get(parameter_name)
+    if cached and now < cached[1]:
+        return cached[0]
+
+    ssm = get_client("ssm")
     try:
         response = ssm.get_parameter(Name=parameter_name)
-        return response["Parameter"]["Value"]
+        value = response["Parameter"]["Value"]
+        _parameter_cache[parameter_name] = (value, now + SSM_CACHE_TTL_SECONDS)
+        return value
     except ssm.exceptions.ParameterNotFound:
         raise ValueError(f"SSM parameter not found: {parameter_name}")
     except Exception as e:
@@ -59,14 +59,17 @@ class CodeInterpreterTools:
 
             results = []
             for event in response["stream"]:
-                if "result" in event:
-                    results.append(event["result"])
+                result = event.get("result")
+                if result is not None:
+                    results.append(result)
 
+            # Compact JSON: the result is read by the model, not a person, and
+            # pretty-printing only adds input tokens.
             return (
-                json.dumps(results, indent=2)
+                json.dumps(results, separators=(",", ":"))
                 if results
-                else json.dumps({"error": "No results returned"}, indent=2)
+                else json.dumps({"error": "No results returned"})
             )
         except Exception as e:
             logger.error(f"Code execution failed: {e}")
-            return json.dumps({"error": f"Code execution failed: {str(e)}"}, indent=2)
+            return json.dumps({"error": f"Code execution failed: {str(e)}"})